@@ -0,0 +1,114 @@
+"""
+Pipeline de ingestão compartilhado pelas páginas do dashboard:
+leitura do CSV, limpeza e features derivadas por pedido.
+"""
+# ============================================================
+# Libraries
+# ============================================================
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+# ============================================================
+# Funções de Limpeza
+# ============================================================
+def clean_code(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Limpeza do dataframe:
+      1. Remove valores NaN
+      2. Converte tipos de dados
+      3. Strip em strings
+      4. Ajusta colunas específicas
+    """
+    df = df.replace("NaN ", np.nan).dropna()
+
+    # Conversões
+    df["Delivery_person_Age"] = pd.to_numeric(df["Delivery_person_Age"])
+    df["Delivery_person_Ratings"] = pd.to_numeric(df["Delivery_person_Ratings"])
+    df["Order_Date"] = pd.to_datetime(df["Order_Date"], format="%d-%m-%Y")
+
+    # Strip em todas as colunas de texto
+    for col in df.select_dtypes(include="object"):
+        df[col] = df[col].str.strip()
+
+    # Ajustes específicos
+    df["Weatherconditions"] = df["Weatherconditions"].str.replace("conditions", "", regex=False)
+    # Algumas latitudes de restaurante vêm com o sinal invertido (ex.: -27.16 para ~27)
+    coord_cols = [
+        "Restaurant_latitude", "Restaurant_longitude",
+        "Delivery_location_latitude", "Delivery_location_longitude"
+    ]
+    df[coord_cols] = df[coord_cols].abs()
+    # Restaurantes em (0, 0) são placeholders: coordenada ausente, não geram distância nem velocidade
+    restaurant_cols = ["Restaurant_latitude", "Restaurant_longitude"]
+    sem_coordenada = (df[restaurant_cols] == 0).all(axis=1)
+    df.loc[sem_coordenada, restaurant_cols] = np.nan
+    df["Time_taken(min)"] = (
+        df["Time_taken(min)"]
+        .str.replace("(min)", "", regex=False)
+        .str.strip()
+        .astype(float)
+    )
+
+    return df
+
+
+# ============================================================
+# Features Derivadas
+# ============================================================
+EARTH_RADIUS_KM = 6371.0088
+DISTANCE_BINS = [0, 5, 10, 15, np.inf]
+DISTANCE_LABELS = ["0-5 km", "5-10 km", "10-15 km", "15+ km"]
+
+
+def haversine_vectorized(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Distância haversine (km) calculada sobre colunas inteiras de uma vez"""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def create_features(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Features por pedido, calculadas uma única vez na ingestão:
+      1. Distance: distância restaurante -> entrega (km)
+      2. Pickup_wait(min): espera entre o pedido e a coleta
+      3. Speed(km/min): velocidade média da entrega
+      4. Distance_band: faixa de distância
+      5. Order_hour: hora do pedido
+    Pedidos sem coordenada do restaurante ficam com Distance, Speed e Distance_band NaN.
+    Colunas de filtro viram category para filtros e agrupamentos mais leves.
+    """
+    df["Distance"] = haversine_vectorized(
+        df["Restaurant_latitude"].to_numpy(),
+        df["Restaurant_longitude"].to_numpy(),
+        df["Delivery_location_latitude"].to_numpy(),
+        df["Delivery_location_longitude"].to_numpy(),
+    ).astype("float32")
+
+    ordered = pd.to_timedelta(df["Time_Orderd"])
+    picked = pd.to_timedelta(df["Time_Order_picked"])
+    # Coletas após a meia-noite de pedidos feitos no dia anterior
+    wait = (picked - ordered) % pd.Timedelta(days=1)
+    df["Pickup_wait(min)"] = (wait.dt.total_seconds() / 60).astype("float32")
+
+    df["Speed(km/min)"] = (df["Distance"] / df["Time_taken(min)"]).astype("float32")
+    df["Distance_band"] = pd.cut(df["Distance"], bins=DISTANCE_BINS, labels=DISTANCE_LABELS, right=False)
+    df["Order_hour"] = ordered.dt.components["hours"].astype("int8")
+
+    for col in ["City", "Road_traffic_density", "Weatherconditions", "Type_of_vehicle", "Festival"]:
+        df[col] = df[col].astype("category")
+
+    return df
+
+
+@st.cache_data
+def load_data(path: str) -> pd.DataFrame:
+    """Lê, limpa e gera as features uma vez; reruns reutilizam o cache"""
+    df = pd.read_csv(path)
+    df = clean_code(df)
+    return create_features(df)
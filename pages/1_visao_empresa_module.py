@@ -1,8 +1,8 @@
 # Libraries
-from haversine import haversine
 import numpy as np
 import pandas as pd
 import streamlit as st
+from data_pipeline import load_data
 import datetime
 from PIL import Image
 import plotly.express as px
@@ -16,7 +16,7 @@ st.set_page_config(page_title='Visão Empresa', page_icon='📈', layout='wide')
 #Funções
 #---------------------------------------------------------------
 def country_maps(df):
-    df_aux = df.loc[:, ['City', 'Road_traffic_density', 'Delivery_location_latitude', 'Delivery_location_longitude']].groupby(['City', 'Road_traffic_density']).median().reset_index()
+    df_aux = df.loc[:, ['City', 'Road_traffic_density', 'Delivery_location_latitude', 'Delivery_location_longitude']].groupby(['City', 'Road_traffic_density'], observed=True).median().reset_index()
     map = folium.Map()  
     for index, location_info in df_aux.iterrows():
         folium.Marker( [location_info['Delivery_location_latitude' ],
@@ -41,12 +41,12 @@ def order_by_week(df):
     return df
 
 def traffic_order_city(df):
-    df_aux = df.loc[:, ['ID', 'City', 'Road_traffic_density']].groupby(['City', 'Road_traffic_density']).count().reset_index()
+    df_aux = df.loc[:, ['ID', 'City', 'Road_traffic_density']].groupby(['City', 'Road_traffic_density'], observed=True).count().reset_index()
     fig = px.scatter(df_aux, x='City', y='Road_traffic_density', size='ID')
     return fig
 
 def traffic_order_share(df):
-    df_aux = df.loc[:, ['ID', 'Road_traffic_density']].groupby('Road_traffic_density').count().reset_index()
+    df_aux = df.loc[:, ['ID', 'Road_traffic_density']].groupby('Road_traffic_density', observed=True).count().reset_index()
     df_aux['Entregas %'] = df_aux['ID'] / (df_aux['ID'].sum())
     fig = px.pie(df_aux, values='Entregas %', names='Road_traffic_density')
     return fig
@@ -63,45 +63,10 @@ def order_metric(df):
     fig = px.bar(df_aux, x='Order_Date', y='ID')
     return fig
     
-def clean_code(df):
-    """ Esta função tem a responsabilidade de limpar o dataframe
-
-        Tipos de limpeza:
-        1. Remoção dos valores NaN
-        2. Conversão de tipos de dados específicos
-        3. Strip dos dados
-        4. Formatação de colunas de Datas
-        5. Outros ajustes
-
-        Input: Dataframe
-        Output: Dataframe
-    """
-    # Substituir valores 'NaN ' por NaN real e remover linhas com NaN
-    df = df.replace('NaN ', np.nan).dropna()
-    
-    # Conversões de tipo
-    df['Delivery_person_Age'] = pd.to_numeric(df['Delivery_person_Age'])
-    df['Delivery_person_Ratings'] = pd.to_numeric(df['Delivery_person_Ratings'])
-    df['Order_Date'] = pd.to_datetime(df['Order_Date'], format='%d-%m-%Y')
-    
-    # Limpeza de strings (strip em todas as colunas de texto)
-    str_cols = df.select_dtypes(include='object').columns
-    df[str_cols] = df[str_cols].apply(lambda col: col.str.strip())
-    
-    # Ajustes específicos
-    df['Weatherconditions'] = df['Weatherconditions'].str.replace('conditions', '', regex=False)
-    df['Time_taken(min)'] = df['Time_taken(min)'].str.replace('(min)', '', regex=False).str.strip()
-    df['Time_taken(min)'] = pd.to_numeric(df['Time_taken(min)'], errors='coerce')
-    return df
-
 #---------------Início da estrutura lógica do código -----------
 #---------------------------------------------------------------
-# Import dataset
-dados = pd.read_csv('dataset/train.csv')
-
-#---------------------------------------------------------------
-#Limpando os dados
-df = clean_code(dados)
+# Import dataset, limpeza dos dados e features
+df = load_data('dataset/train.csv')
 
 #============================================================
 # Barra lateral
@@ -1,8 +1,8 @@
 # Libraries
-from haversine import haversine
 import numpy as np
 import pandas as pd
 import streamlit as st
+from data_pipeline import load_data
 import datetime
 from PIL import Image
 import plotly.express as px
@@ -14,54 +14,19 @@ st.set_page_config(page_title='Visão Entregadores', page_icon='🚚', layout='w
 #---------------------------------------------------------------
 #Funções
 #---------------------------------------------------------------
-def clean_code(df):
-    """ Esta função tem a responsabilidade de limpar o dataframe
-
-        Tipos de limpeza:
-        1. Remoção dos valores NaN
-        2. Conversão de tipos de dados específicos
-        3. Strip dos dados
-        4. Formatação de colunas de Datas
-        5. Outros ajustes
-
-        Input: Dataframe
-        Output: Dataframe
-    """
-    # Substituir valores 'NaN ' por NaN real e remover linhas com NaN
-    df = df.replace('NaN ', np.nan).dropna()
-    
-    # Conversões de tipo
-    df['Delivery_person_Age'] = pd.to_numeric(df['Delivery_person_Age'])
-    df['Delivery_person_Ratings'] = pd.to_numeric(df['Delivery_person_Ratings'])
-    df['Order_Date'] = pd.to_datetime(df['Order_Date'], format='%d-%m-%Y')
-    
-    # Limpeza de strings (strip em todas as colunas de texto)
-    str_cols = df.select_dtypes(include='object').columns
-    df[str_cols] = df[str_cols].apply(lambda col: col.str.strip())
-    
-    # Ajustes específicos
-    df['Weatherconditions'] = df['Weatherconditions'].str.replace('conditions', '', regex=False)
-    df['Time_taken(min)'] = df['Time_taken(min)'].str.replace('(min)', '', regex=False).str.strip()
-    df['Time_taken(min)'] = pd.to_numeric(df['Time_taken(min)'], errors='coerce')
-    return df
-
 def top_delivers(df, top_asc):
     # Calcular a média de 'Time_taken(min)' por cidade e entregador
-    media_lenta = (df.groupby(['City', 'Delivery_person_ID'])['Time_taken(min)']
+    media_lenta = (df.groupby(['City', 'Delivery_person_ID'], observed=True)['Time_taken(min)']
                    .mean()
                    .reset_index()
                    .sort_values(by=['City', 'Time_taken(min)'], ascending=top_asc)
-                   .groupby('City')
+                   .groupby('City', observed=True)
                    .head(10))
     media_lenta = media_lenta.reset_index(drop=True)  
     return media_lenta
 
-# Import dataset
-dados = pd.read_csv('dataset/train.csv')
-
-#---------------------------------------------------------------
-#Limpando os dados
-df = clean_code(dados)
+# Import dataset, limpeza dos dados e features
+df = load_data('dataset/train.csv')
 
 #============================================================
 # Barra lateral
@@ -144,7 +109,7 @@ with tab1:
         with col2:
             st.markdown('##### Avaliação média por Trânsito')
             avaliacao_media_transito = (df[['Road_traffic_density', 'Delivery_person_Ratings']]
-                                        .groupby('Road_traffic_density')
+                                        .groupby('Road_traffic_density', observed=True)
                                         .agg({'Delivery_person_Ratings': ['mean', 'std']}))
             avaliacao_media_transito.columns = ['delivery_mean', 'delivery_std']
             avaliacao_media_transito = avaliacao_media_transito.reset_index()
@@ -152,7 +117,7 @@ with tab1:
             
             st.markdown('##### Avaliação média por Clima')
             avaliacao_media_clima = (df[['Delivery_person_Ratings', 'Weatherconditions']]
-                                     .groupby('Weatherconditions')
+                                     .groupby('Weatherconditions', observed=True)
                                      .agg({'Delivery_person_Ratings':['mean', 'std']}))
             avaliacao_media_clima.columns = ['delivery_mean', 'delivery_std']
             avaliacao_media_clima = avaliacao_media_clima.reset_index()
@@ -5,69 +5,22 @@ import datetime
 import numpy as np
 import pandas as pd
 import streamlit as st
-from haversine import haversine
 from PIL import Image
 import plotly.express as px
 import plotly.graph_objects as go
+from data_pipeline import load_data
 
 st.set_page_config(page_title='Visão Restaurante', page_icon='🍽️', layout='wide')
 
-# ============================================================
-# Funções de Limpeza
-# ============================================================
-def clean_code(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Limpeza do dataframe:
-      1. Remove valores NaN
-      2. Converte tipos de dados
-      3. Strip em strings
-      4. Ajusta colunas específicas
-    """
-    df = df.replace("NaN ", np.nan).dropna()
-
-    # Conversões
-    df["Delivery_person_Age"] = pd.to_numeric(df["Delivery_person_Age"])
-    df["Delivery_person_Ratings"] = pd.to_numeric(df["Delivery_person_Ratings"])
-    df["Order_Date"] = pd.to_datetime(df["Order_Date"], format="%d-%m-%Y")
-
-    # Strip em todas as colunas de texto
-    for col in df.select_dtypes(include="object"):
-        df[col] = df[col].str.strip()
-
-    # Ajustes específicos
-    df["Weatherconditions"] = df["Weatherconditions"].str.replace("conditions", "", regex=False)
-    df["Time_taken(min)"] = (
-        df["Time_taken(min)"]
-        .str.replace("(min)", "", regex=False)
-        .str.strip()
-        .astype(float)
-    )
-
-    return df
-
-
 # ============================================================
 # Funções de Métricas e Gráficos
 # ============================================================
 def distance(df: pd.DataFrame, return_fig: bool = False):
     """Calcula a distância média ou retorna gráfico de pizza por cidade"""
-    cols = [
-        "Delivery_location_latitude", "Delivery_location_longitude",
-        "Restaurant_latitude", "Restaurant_longitude"
-    ]
-
-    df["Distance"] = df[cols].apply(
-        lambda x: haversine(
-            (x["Delivery_location_latitude"], x["Delivery_location_longitude"]),
-            (x["Restaurant_latitude"], x["Restaurant_longitude"])
-        ),
-        axis=1,
-    )
-
     if not return_fig:
-        return np.round(df["Distance"].mean(), 2)
+        return round(float(df["Distance"].mean()), 2)
 
-    df_aux = df.groupby("City", as_index=False)["Distance"].mean()
+    df_aux = df.groupby("City", as_index=False, observed=True)["Distance"].mean()
     return go.Figure(
         data=[go.Pie(labels=df_aux["City"], values=df_aux["Distance"], pull=[0, 0.1, 0])]
     )
@@ -76,7 +29,7 @@ def distance(df: pd.DataFrame, return_fig: bool = False):
 def avg_std_time_delivery(df: pd.DataFrame, festival: str, op: str) -> float:
     """Retorna tempo médio ou desvio padrão de entregas em festivais"""
     df_aux = (
-        df.groupby("Festival")["Time_taken(min)"]
+        df.groupby("Festival", observed=True)["Time_taken(min)"]
         .agg(["mean", "std"])
         .rename(columns={"mean": "avg_time", "std": "std_time"})
         .reset_index()
@@ -89,11 +42,13 @@ def avg_std_time_delivery(df: pd.DataFrame, festival: str, op: str) -> float:
 def avg_std_time_on_traffic(df: pd.DataFrame):
     """Retorna gráfico Sunburst do tempo médio e std por cidade e trânsito"""
     df_aux = (
-        df.groupby(["City", "Road_traffic_density"])["Time_taken(min)"]
+        df.groupby(["City", "Road_traffic_density"], observed=True)["Time_taken(min)"]
         .agg(["mean", "std"])
         .rename(columns={"mean": "avg_time", "std": "std_time"})
         .reset_index()
     )
+    # O px.sunburst agrupa o path internamente; com category ele recriaria as combinações não observadas
+    df_aux[["City", "Road_traffic_density"]] = df_aux[["City", "Road_traffic_density"]].astype(str)
 
     return px.sunburst(
         df_aux,
@@ -105,11 +60,32 @@ def avg_std_time_on_traffic(df: pd.DataFrame):
     )
 
 
+def median_speed_by(df: pd.DataFrame, col: str):
+    """Retorna gráfico de barras da velocidade mediana (km/min) por categoria"""
+    df_aux = (
+        df.groupby(col, observed=True)["Speed(km/min)"]
+        .median()
+        .reset_index(name="median_speed")
+    )
+
+    return px.bar(df_aux, x=col, y="median_speed")
+
+
+def avg_time_by_hour(df: pd.DataFrame):
+    """Retorna gráfico de linha da espera de coleta e tempo de entrega por hora do pedido"""
+    df_aux = (
+        df.groupby("Order_hour")[["Pickup_wait(min)", "Time_taken(min)"]]
+        .mean()
+        .reset_index()
+    )
+
+    return px.line(df_aux, x="Order_hour", y=["Pickup_wait(min)", "Time_taken(min)"], markers=True)
+
+
 # ============================================================
 # Import e Limpeza
 # ============================================================
-df = pd.read_csv("dataset/train.csv")
-df = clean_code(df)
+df = load_data("dataset/train.csv")
 
 
 #============================================================
@@ -156,7 +132,7 @@ df = df.loc[linhas_selecionadas, :]
 # ============================================================
 # Layout no Streamlit
 # ============================================================
-tab1, tab2, tab3 = st.tabs(["Visão Gerencial", "_", "_"])
+tab1, tab2, tab3 = st.tabs(["Visão Gerencial", "Visão Velocidade", "_"])
 
 with tab1:
     # ---------------------------
@@ -180,7 +156,7 @@ with tab1:
     st.title("Tempo Médio de Entrega por Cidade")
 
     df_aux = (
-        df.groupby("City")["Time_taken(min)"]
+        df.groupby("City", observed=True)["Time_taken(min)"]
         .agg(["mean", "std"])
         .rename(columns={"mean": "avg_time", "std": "std_time"})
         .reset_index()
@@ -215,9 +191,40 @@ with tab1:
     st.markdown("___")
     cols = ["City", "Time_taken(min)", "Type_of_order"]
     df_aux = (
-        df.groupby(["City", "Type_of_order"])["Time_taken(min)"]
+        df.groupby(["City", "Type_of_order"], observed=True)["Time_taken(min)"]
         .agg(["mean", "std"])
         .rename(columns={"mean": "avg_time", "std": "std_time"})
         .reset_index()
     )
     st.dataframe(df_aux)
+
+with tab2:
+    # ---------------------------
+    # Velocidade de entrega
+    # ---------------------------
+    st.markdown("___")
+    st.title("Velocidade Mediana de Entrega (km/min)")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("##### Por Trânsito")
+        st.plotly_chart(median_speed_by(df, "Road_traffic_density"), use_container_width=True)
+    with col2:
+        st.markdown("##### Por Clima")
+        st.plotly_chart(median_speed_by(df, "Weatherconditions"), use_container_width=True)
+    with col3:
+        st.markdown("##### Por Veículo")
+        st.plotly_chart(median_speed_by(df, "Type_of_vehicle"), use_container_width=True)
+
+    # ---------------------------
+    # Faixas de distância e horário
+    # ---------------------------
+    st.markdown("___")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("##### Velocidade Mediana por Faixa de Distância")
+        st.plotly_chart(median_speed_by(df, "Distance_band"), use_container_width=True)
+    with col2:
+        st.markdown("##### Espera de Coleta e Tempo de Entrega por Hora do Pedido")
+        st.plotly_chart(avg_time_by_hour(df), use_container_width=True)
@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_pipeline import EARTH_RADIUS_KM, clean_code, create_features
+
+DATASET = Path(__file__).resolve().parent.parent / "dataset" / "train.csv"
+
+
+def make_orders(distances_km, ordered="11:30:00", picked="11:45:00", time_taken=20.0):
+    """Pedidos já limpos, com o restaurante a `distances_km` ao sul da entrega no mesmo meridiano"""
+    n = len(distances_km)
+    delivery_lat = 22.0
+    offsets = np.degrees(np.asarray(distances_km, dtype=float) / EARTH_RADIUS_KM)
+    return pd.DataFrame({
+        "Restaurant_latitude": delivery_lat - offsets,
+        "Restaurant_longitude": [75.0] * n,
+        "Delivery_location_latitude": [delivery_lat] * n,
+        "Delivery_location_longitude": [75.0] * n,
+        "Time_Orderd": [ordered] * n,
+        "Time_Order_picked": [picked] * n,
+        "Time_taken(min)": [time_taken] * n,
+        "City": ["Urban"] * n,
+        "Road_traffic_density": ["Low"] * n,
+        "Weatherconditions": ["Sunny"] * n,
+        "Type_of_vehicle": ["motorcycle"] * n,
+        "Festival": ["No"] * n,
+    })
+
+
+def test_distance_and_speed():
+    df = create_features(make_orders([10.0], time_taken=20.0))
+
+    assert df["Distance"].iloc[0] == pytest.approx(10.0, rel=1e-5)
+    assert df["Speed(km/min)"].iloc[0] == pytest.approx(0.5, rel=1e-5)
+
+
+def test_pickup_wait_wraps_past_midnight():
+    df = create_features(make_orders([1.0], ordered="23:55:00", picked="00:10:00"))
+
+    assert df["Pickup_wait(min)"].iloc[0] == 15
+    assert df["Order_hour"].iloc[0] == 23
+
+
+def test_pickup_wait_same_day():
+    df = create_features(make_orders([1.0], ordered="08:05:00", picked="08:20:00"))
+
+    assert df["Pickup_wait(min)"].iloc[0] == 15
+    assert df["Order_hour"].iloc[0] == 8
+
+
+def test_distance_band_edges():
+    distances = [0.5, 4.999, 5.001, 9.999, 10.001, 14.999, 15.001, 30.0, 500.0]
+    df = create_features(make_orders(distances))
+
+    assert df["Distance_band"].tolist() == [
+        "0-5 km", "0-5 km",
+        "5-10 km", "5-10 km",
+        "10-15 km", "10-15 km",
+        "15+ km", "15+ km", "15+ km",
+    ]
+
+
+def test_clean_code_fixes_restaurant_coordinates():
+    df = make_orders([2.0, 2.0, 2.0])
+    df.loc[1, "Restaurant_latitude"] *= -1
+    df.loc[2, ["Restaurant_latitude", "Restaurant_longitude"]] = 0.0
+    df["Order_Date"] = "19-03-2022"
+    df["Delivery_person_Age"] = "30"
+    df["Delivery_person_Ratings"] = "4.5"
+    df["Time_taken(min)"] = "(min) 20"
+
+    df = create_features(clean_code(df))
+
+    assert df["Distance"].iloc[:2].to_numpy() == pytest.approx([2.0, 2.0], rel=1e-5)
+    assert df.loc[2, ["Distance", "Speed(km/min)"]].isna().all()
+    assert pd.isna(df.loc[2, "Distance_band"])
+
+
+def test_shipped_dataset_features():
+    df = create_features(clean_code(pd.read_csv(DATASET)))
+    sem_coordenada = df["Restaurant_latitude"].isna()
+
+    assert not df[["Pickup_wait(min)", "Order_hour", "Time_taken(min)"]].isna().any().any()
+    assert df["Order_hour"].between(0, 23).all()
+    assert (df["Pickup_wait(min)"] >= 0).all()
+
+    for col in ["Distance", "Speed(km/min)", "Distance_band"]:
+        assert df[col].isna().equals(sem_coordenada)
+    assert (df["Restaurant_latitude"].dropna() > 0).all()
+    assert (df.loc[~sem_coordenada, "Speed(km/min)"] > 0).all()